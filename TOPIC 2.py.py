@@ -3,65 +3,469 @@ from tkinter import messagebox
 from tkinter import ttk  # For using the Combobox
 import re  # Regular expression module for phone validation
 import heapq  # For implementing MinHeap functionality
+import math  # For percentile rank rounding
+import random  # For generating benchmark bookings
+import sys  # For the --benchmark command line flag
+import time  # For timing the benchmark
+from array import array  # For compact, fixed-width booking columns
+
+# BookingStore Class
+class BookingStore:
+    # Column-oriented booking records shared by the BST and MinHeap, referenced by integer id.
+    # Destinations are stored once and referenced by a small id; names and phones are interned.
+    def __init__(self):
+        self.destination_names = []  # destination id -> destination name
+        self.destination_ids = {}  # destination name -> destination id
+        self.destinations = array('I')  # record id -> destination id
+        self.names = []  # record id -> passenger name
+        self.phones = []  # record id -> phone number
+        self.free_ids = []  # Released record ids, reused before the columns grow
+
+    def __len__(self):
+        return len(self.names) - len(self.free_ids)
+
+    def add(self, destination, name, phone):
+        # Store one booking and return its record id
+        destination_id = self.destination_ids.get(destination)
+        if destination_id is None:
+            destination_id = len(self.destination_names)
+            self.destination_names.append(destination)
+            self.destination_ids[destination] = destination_id
+        name, phone = sys.intern(name), sys.intern(phone)
+        if self.free_ids:
+            record_id = self.free_ids.pop()
+            self.destinations[record_id] = destination_id
+            self.names[record_id] = name
+            self.phones[record_id] = phone
+        else:
+            record_id = len(self.names)
+            self.destinations.append(destination_id)
+            self.names.append(name)
+            self.phones.append(phone)
+        return record_id
+
+    def get(self, record_id):
+        # Returns (destination, name, phone)
+        return self.destination_names[self.destinations[record_id]], self.names[record_id], self.phones[record_id]
+
+    def release(self, record_id):
+        # Free a record for reuse once no structure references it any more
+        self.names[record_id] = self.phones[record_id] = None
+        self.free_ids.append(record_id)
 
 # BinarySearchTree Class
 class BinaryTreeNode:
-    def __init__(self, key, destination, name, phone):
+    __slots__ = ("left", "right", "height", "size", "key", "record_id")  # No per-node __dict__
+
+    def __init__(self, key, record_id):
         self.left = None
         self.right = None
+        self.height = 1  # Height of the subtree rooted here (used by the balanced mode)
+        self.size = 1  # Number of bookings in the subtree rooted here (for rank/select)
         self.key = key  # Rating or popularity (based on cost)
-        self.destination = destination
-        self.name = name
-        self.phone = phone
+        self.record_id = record_id  # Destination, name and phone live in the BookingStore
 
 class BinarySearchTree:
-    def __init__(self):
+    def __init__(self, balanced=False, store=None):
         self.root = None
+        self.balanced = balanced  # AVL rebalancing keeps sorted feeds at O(log n) per insert
+        self.store = store if store is not None else BookingStore()
+
+    @classmethod
+    def from_iterable(cls, rows, presorted=False, balanced=False, store=None):
+        # Build a perfectly balanced tree from (cost, destination, name, phone) rows in O(n)
+        rows = list(rows)
+        if not presorted:
+            rows.sort(key=lambda row: row[0])  # Stable, so equal costs keep their arrival order
+        tree = cls(balanced=balanced, store=store)
+        nodes = [tree._new_node(*row) for row in rows]
+        tree.root = tree._build_balanced(nodes, 0, len(nodes))
+        return tree
+
+    def _new_node(self, key, destination, name, phone):
+        return BinaryTreeNode(key, self.store.add(destination, name, phone))
+
+    def bulk_insert(self, rows):
+        # Merge a batch of rows into the tree in O(n + m), then rebuild it balanced
+        batch = [self._new_node(*row) for row in rows]
+        if any(batch[i].key > batch[i + 1].key for i in range(len(batch) - 1)):
+            batch.sort(key=lambda node: node.key)
+
+        merged = []
+        existing = self._iter_nodes()
+        current = next(existing, None)
+        for new_node in batch:
+            while current is not None and current.key <= new_node.key:  # Existing bookings first on ties
+                merged.append(current)
+                current = next(existing, None)
+            merged.append(new_node)
+        while current is not None:
+            merged.append(current)
+            current = next(existing, None)
+
+        self.root = self._build_balanced(merged, 0, len(merged))
+
+    def _build_balanced(self, nodes, lo, hi):
+        # Link nodes[lo:hi] (already in order) into a balanced subtree; depth is only O(log n)
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._build_balanced(nodes, lo, mid)
+        node.right = self._build_balanced(nodes, mid + 1, hi)
+        self._update(node)
+        return node
 
     def insert(self, key, destination, name, phone):
+        new_node = self._new_node(key, destination, name, phone)
         if self.root is None:
-            self.root = BinaryTreeNode(key, destination, name, phone)
-        else:
-            self._insert_recursive(self.root, key, destination, name, phone)
+            self.root = new_node
+            return
 
-    def _insert_recursive(self, node, key, destination, name, phone):
-        if key < node.key:
-            if node.left is None:
-                node.left = BinaryTreeNode(key, destination, name, phone)
-            else:
-                self._insert_recursive(node.left, key, destination, name, phone)
+        # Walk down iteratively (no recursion limit), remembering the path for rebalancing
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node.size += 1  # The new booking lands somewhere below this node
+            node = node.left if key < node.key else node.right  # Equal costs go right, as before
+
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
         else:
-            if node.right is None:
-                node.right = BinaryTreeNode(key, destination, name, phone)
+            parent.right = new_node
+
+        if self.balanced:
+            self._rebalance_path(path)
+
+    def _rebalance_path(self, path):
+        # Walk back up from the new leaf, fixing heights and rotating where needed
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new_top = self._rebalance(node)
+            if new_top is node:
+                continue
+            if i == 0:
+                self.root = new_top
+            elif path[i - 1].left is node:
+                path[i - 1].left = new_top
             else:
-                self._insert_recursive(node.right, key, destination, name, phone)
+                path[i - 1].right = new_top
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
+
+    def _update(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_left(self, node):
+        top = node.right
+        node.right = top.left
+        top.left = node
+        self._update(node)
+        self._update(top)
+        return top
+
+    def _rotate_right(self, node):
+        top = node.left
+        node.left = top.right
+        top.right = node
+        self._update(node)
+        self._update(top)
+        return top
+
+    def _rebalance(self, node):
+        # Returns the node that now sits where `node` was
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def __len__(self):
+        return self._size(self.root)
+
+    def rank(self, cost):
+        # Number of bookings strictly cheaper than cost, in O(height)
+        rank = 0
+        node = self.root
+        while node:
+            if cost <= node.key:
+                node = node.left
+            else:
+                rank += self._size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, i):
+        # The i-th cheapest booking (0-based), in O(height)
+        if not 0 <= i < len(self):
+            raise IndexError("Booking index out of range.")
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if i < left_size:
+                node = node.left
+            elif i == left_size:
+                return self._record(node)
+            else:
+                i -= left_size + 1
+                node = node.right
+
+    def median(self):
+        # Median trip cost, averaging the two middle costs for an even count
+        n = len(self)
+        if n == 0:
+            return None
+        middle = self.select(n // 2)[3]
+        if n % 2:
+            return middle
+        return (self.select(n // 2 - 1)[3] + middle) / 2
+
+    def percentile(self, p):
+        # Nearest-rank percentile of the trip costs, e.g. percentile(90) for p90
+        if not 0 <= p <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        n = len(self)
+        if n == 0:
+            return None
+        return self.select(max(math.ceil(p * n / 100) - 1, 0))[3]  # Multiply first so p * n stays exact
 
     def inorder(self):
-        passengers = []
-        self._inorder_recursive(self.root, passengers)
-        return passengers
-
-    def _inorder_recursive(self, node, passengers):
-        if node:
-            self._inorder_recursive(node.left, passengers)
-            passengers.append((node.name, node.phone, node.destination, node.key))  # name, phone, destination, cost
-            self._inorder_recursive(node.right, passengers)
+        return [self._record(node) for node in self._iter_nodes()]
+
+    def range(self, lo, hi):
+        # Lazily yield bookings with lo <= cost <= hi, skipping subtrees outside the range
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.key < lo:
+                    node = node.right  # This node and its left subtree are all below lo
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return  # Ran off the right edge: nothing left that is >= lo
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield self._record(node)
+            node = node.right
+
+    def k_smallest(self, k):
+        # Lazily yield the k cheapest bookings, cheapest first
+        for count, node in enumerate(self._iter_nodes()):
+            if count >= k:
+                return
+            yield self._record(node)
+
+    def k_largest(self, k):
+        # Lazily yield the k most expensive bookings, most expensive first
+        for count, node in enumerate(self._iter_nodes(reverse=True)):
+            if count >= k:
+                return
+            yield self._record(node)
+
+    def _record(self, node):
+        destination, name, phone = self.store.get(node.record_id)
+        return (name, phone, destination, node.key)  # name, phone, destination, cost
+
+    def _iter_nodes(self, reverse=False):
+        # Iterative in-order walk so deep trees never overflow the stack
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
+            yield node
+            node = node.left if reverse else node.right
+
+def benchmark_bulk_load(n=200000):
+    # Compare bulk loading against one insert call per row, on sorted and shuffled feeds
+    rows = [(float(cost), "Lake Kivu", f"Passenger {cost}", "0780000000") for cost in range(n)]
+    shuffled = rows[:]
+    random.shuffle(shuffled)
+    for label, feed, presorted in (("sorted", rows, True), ("shuffled", shuffled, False)):
+        start = time.perf_counter()
+        tree = BinarySearchTree(balanced=True)
+        for row in feed:
+            tree.insert(*row)
+        per_row = time.perf_counter() - start
+
+        start = time.perf_counter()
+        BinarySearchTree.from_iterable(feed, presorted=presorted, balanced=True)
+        bulk = time.perf_counter() - start
+
+        # Build from the first half, then merge the second half into it both ways
+        half = n // 2
+        first, second = feed[:half], feed[half:]
+        tree = BinarySearchTree.from_iterable(first, presorted=presorted, balanced=True)
+        start = time.perf_counter()
+        for row in second:
+            tree.insert(*row)
+        merge_per_row = time.perf_counter() - start
+
+        tree = BinarySearchTree.from_iterable(first, presorted=presorted, balanced=True)
+        start = time.perf_counter()
+        tree.bulk_insert(second)
+        merge = time.perf_counter() - start
+
+        print(f"{label:>8} n={n}: per-row insert {per_row:.3f}s, from_iterable {bulk:.3f}s, "
+              f"merge {n - half} rows: per-row insert {merge_per_row:.3f}s, bulk_insert {merge:.3f}s")
 
 # MinHeap Class
 class MinHeap:
-    def __init__(self):
-        self.heap = []
-
-    def add(self, cost, destination, name, phone):
-        heapq.heappush(self.heap, (cost, destination, name, phone))
+    def __init__(self, store=None):
+        # The heap is kept as parallel columns instead of one tuple per entry
+        self.costs = array('d')  # heap position -> cost
+        self.record_ids = array('q')  # heap position -> BookingStore record id
+        self.booking_ids = []  # heap position -> booking id
+        self.positions = {}  # booking_id -> heap position
+        self.next_id = 0  # Used when a booking is added without an explicit id
+        self.store = store if store is not None else BookingStore()
+
+    def __len__(self):
+        return len(self.costs)
+
+    def __contains__(self, booking_id):
+        return booking_id in self.positions
+
+    def contains(self, booking_id):
+        return booking_id in self.positions
+
+    def add(self, cost, destination, name, phone, booking_id=None):
+        # Returns the booking id so the caller can reprice or cancel it later
+        if booking_id is None:
+            while self.next_id in self.positions:
+                self.next_id += 1
+            booking_id = self.next_id
+            self.next_id += 1
+        elif booking_id in self.positions:
+            raise ValueError(f"Booking {booking_id!r} is already in the heap.")
+        self.costs.append(cost)
+        self.record_ids.append(self.store.add(destination, name, phone))
+        self.booking_ids.append(booking_id)
+        self.positions[booking_id] = len(self.costs) - 1
+        self._sift_up(len(self.costs) - 1)
+        return booking_id
+
+    def _entry(self, i):
+        destination, name, phone = self.store.get(self.record_ids[i])
+        return name, phone, destination, self.costs[i]  # name, phone, destination, cost
 
     def get_cheapest(self):
-        if self.heap:
-            return self.heap[0][2], self.heap[0][3], self.heap[0][1], self.heap[0][0]  # name, phone, destination, cost
+        if self.costs:
+            return self._entry(0)
         return None, None, None, None
 
-    def show_all(self):
-        return [f"{name} ({phone}) - {dest} - {cost} RWF" for cost, dest, name, phone in self.heap]
+    def pop(self):
+        # Remove and return the cheapest booking as (name, phone, destination, cost)
+        if not self.costs:
+            raise IndexError("pop from an empty MinHeap")
+        return self._remove_at(0)
+
+    def update_cost(self, booking_id, new_cost):
+        # Reprice a live booking in O(log n), moving it up or down as needed
+        i = self.positions[booking_id]
+        old_cost = self.costs[i]
+        self.costs[i] = new_cost
+        if new_cost < old_cost:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, booking_id):
+        # Cancel a booking in O(log n) and return it as (name, phone, destination, cost)
+        return self._remove_at(self.positions[booking_id])
+
+    def _remove_at(self, i):
+        entry = self._entry(i)
+        cost = self.costs[i]
+        self.store.release(self.record_ids[i])
+        del self.positions[self.booking_ids[i]]
+        last = len(self.costs) - 1
+        if i < last:
+            # Fill the hole with the last entry and restore the heap order around it
+            self.costs[i] = self.costs[last]
+            self.record_ids[i] = self.record_ids[last]
+            self.booking_ids[i] = self.booking_ids[last]
+            self.positions[self.booking_ids[i]] = i
+        self.costs.pop()
+        self.record_ids.pop()
+        self.booking_ids.pop()
+        if i < last:
+            if self.costs[i] < cost:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        return entry
+
+    def _swap(self, i, j):
+        self.costs[i], self.costs[j] = self.costs[j], self.costs[i]
+        self.record_ids[i], self.record_ids[j] = self.record_ids[j], self.record_ids[i]
+        self.booking_ids[i], self.booking_ids[j] = self.booking_ids[j], self.booking_ids[i]
+        self.positions[self.booking_ids[i]] = i
+        self.positions[self.booking_ids[j]] = j
+
+    def _sift_up(self, i):
+        costs = self.costs
+        while i > 0:
+            parent = (i - 1) // 2
+            if costs[i] >= costs[parent]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        costs = self.costs
+        n = len(costs)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and costs[child] < costs[smallest]:
+                    smallest = child
+            if smallest == i:
+                break
+            self._swap(i, smallest)
+            i = smallest
+
+    def iter_sorted(self):
+        # Lazily yield (name, phone, destination, cost) in ascending cost order without touching the heap.
+        # A small frontier heap walks the implicit tree: a child can only follow its parent.
+        if not self.costs:
+            return
+        frontier = [(self.costs[0], 0)]
+        n = len(self.costs)
+        while frontier:
+            _, i = heapq.heappop(frontier)
+            yield self._entry(i)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n:
+                    heapq.heappush(frontier, (self.costs[child], child))
+
+    def show_all(self, offset=0, limit=None):
+        # Stream one page of bookings, cheapest first; only the page itself is formatted
+        for position, (name, phone, dest, cost) in enumerate(self.iter_sorted()):
+            if limit is not None and position >= offset + limit:
+                return
+            if position >= offset:
+                yield f"{name} ({phone}) - {dest} - {cost} RWF"
 
 # GUI with Tkinter
 class TravelApp:
@@ -81,9 +485,10 @@ class TravelApp:
         self.root.geometry(f"{self.window_width}x{self.window_height}")  # Set window size to 50% width
         self.root.configure(bg='#dfe6e9')  # Background color
 
-        # Initialize BinarySearchTree and MinHeap
-        self.bst = BinarySearchTree()
-        self.min_heap = MinHeap()
+        # Initialize BinarySearchTree and MinHeap over one shared booking store
+        self.bookings = BookingStore()
+        self.bst = BinarySearchTree(balanced=True, store=self.bookings)
+        self.min_heap = MinHeap(store=self.bookings)
 
         # Predefined destinations and their base costs
         self.destinations = {
@@ -276,6 +681,9 @@ class TravelApp:
             self.cheapest_listbox.insert(tk.END, "No destinations in MinHeap.")
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = TravelApp(root)
-    root.mainloop()
+    if "--benchmark" in sys.argv:
+        benchmark_bulk_load()
+    else:
+        root = tk.Tk()
+        app = TravelApp(root)
+        root.mainloop()
@@ -2,18 +2,42 @@ import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 from tkcalendar import DateEntry  # Import the DateEntry widget from tkcalendar
+import asyncio  # For the asyncio front-end
+import mmap  # Memory-mapped storage for the persistent queue
+import os  # File handling for the persistent queue
+import struct  # Fixed-width records for the columnar queue
+import sys  # For the --benchmark command line flag
+from datetime import date as Date  # Dates are stored as day ordinals in the columnar queue
+from collections import deque  # Waiting producers/consumers of the asyncio front-end
+import threading  # Locks and condition variables for the producer/consumer queue
+import time  # For timing the benchmark
+from queue import Empty, Full  # Same exceptions as the standard library queue
 
 # Circular Queue class to manage itinerary orders
 class CircularQueue:
-    def __init__(self, max_size=5):
+    FULL_MODES = ("reject", "overwrite", "grow")
+
+    def __init__(self, max_size=5, on_full="reject"):
+        # on_full: "reject" refuses new items, "overwrite" drops the oldest item,
+        # "grow" doubles the capacity
+        if on_full not in self.FULL_MODES:
+            raise ValueError(f"Unknown full-queue mode: {on_full}")
         self.max_size = max_size
-        self.queue = [None] * max_size
+        self.queue = self._allocate(max_size)
         self.front = -1
         self.rear = -1
+        self.on_full = on_full
 
     def enqueue(self, username, phone, destination, activity, date):
+        record = self._encode((username, phone, destination, activity, date))  # Validate before moving pointers
         if (self.rear + 1) % self.max_size == self.front:
-            return False  # Queue is full
+            if self.on_full == "reject":
+                return False  # Queue is full
+            if self.on_full == "overwrite":
+                # Sliding window: the oldest slot becomes the newest in one step
+                self.front = (self.front + 1) % self.max_size
+            else:
+                self._grow()
 
         if self.front == -1:  # If the queue is empty
             self.front = 0
@@ -21,14 +45,48 @@ class CircularQueue:
         else:
             self.rear = (self.rear + 1) % self.max_size
 
-        self.queue[self.rear] = (username, phone, destination, activity, date)
+        self._store(self.rear, record)
         return True
 
+    # Storage hooks: a plain list of tuples here, overridden by ColumnarCircularQueue
+    def _allocate(self, size):
+        return [None] * size
+
+    def _encode(self, item):
+        return item
+
+    def _store(self, slot, record):
+        self.queue[slot] = record
+
+    def _load(self, slot):
+        return self.queue[slot]
+
+    def _copy_segment(self, lo, hi):
+        return self.queue[lo:hi]
+
+    def _grow(self):
+        # Double the backing list, copying the items once so they start at index 0 again
+        items = self.queue[self.front:] + self.queue[:self.front]
+        self.queue = items + [None] * self.max_size
+        self.front = 0
+        self.rear = self.max_size - 1
+        self.max_size *= 2
+
+    def has_room(self):
+        # Whether enqueue would accept an item right now
+        return self.on_full != "reject" or not self.is_full()
+
+    def is_empty(self):
+        return self.front == -1
+
+    def is_full(self):
+        return (self.rear + 1) % self.max_size == self.front
+
     def dequeue(self):
         if self.front == -1:
             return None  # Queue is empty
 
-        item = self.queue[self.front]
+        item = self._load(self.front)
         if self.front == self.rear:
             self.front = -1
             self.rear = -1
@@ -37,18 +95,464 @@ class CircularQueue:
 
         return item
 
-    def display(self):
+    def __len__(self):
+        if self.front == -1:
+            return 0
+        return (self.rear - self.front) % self.max_size + 1
+
+    def _segments(self, start, stop):
+        # The ring positions for logical items [start, stop) as at most two contiguous (lo, hi) ranges
+        lo = self.front + start
+        hi = self.front + stop
+        if hi <= self.max_size:
+            return (lo, hi), (0, 0)
+        if lo >= self.max_size:
+            return (lo - self.max_size, hi - self.max_size), (0, 0)
+        return (lo, self.max_size), (0, hi - self.max_size)
+
+    def __iter__(self):
+        # Oldest to newest, read straight from the ring without building a list
         if self.front == -1:
+            return
+        for lo, hi in self._segments(0, len(self)):
+            for i in range(lo, hi):
+                yield self._load(i)
+
+    def peek(self, i):
+        # The i-th item from the front (negative counts from the rear), without removing it
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("CircularQueue index out of range")
+        return self._load((self.front + i) % self.max_size)
+
+    def slice(self, start=None, stop=None):
+        # Items [start:stop] from the front as a list, copied as at most two contiguous segments
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
             return []
+        (lo, hi), (lo2, hi2) = self._segments(start, stop)
+        return self._copy_segment(lo, hi) + self._copy_segment(lo2, hi2)
+
+    def display(self):
+        return self.slice()
+
+
+# Interned strings: each distinct value is stored once and referred to by its index
+class StringTable:
+    def __init__(self, limit):
+        self.limit = limit  # Number of ids the record field can hold
+        self.values = []  # id -> string
+        self.ids = {}  # string -> id
+
+    def check(self, value):
+        # Raise ValueError if value would need an id past the limit; changes nothing
+        if value not in self.ids and len(self.values) >= self.limit:
+            raise ValueError(f"Too many distinct values to store {value!r}.")
+
+    def id_of(self, value):
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = len(self.values)
+            self.values.append(value)
+            self.ids[value] = value_id
+        return value_id
+
+
+# CircularQueue whose slots are fixed-width records in one preallocated buffer, so enqueue/dequeue
+# allocate no per-item objects and the whole ring can be snapshotted with a single bytes copy
+class ColumnarCircularQueue(CircularQueue):
+    # username (UTF-8), destination id, activity id, phone number, phone digit count, date ordinal.
+    # Usernames are stored inline so memory stays bounded by capacity; only the small set of
+    # destinations and activities is interned.
+    RECORD = struct.Struct("<40sHHQBI")
+
+    def __init__(self, max_size=5, on_full="reject"):
+        self.destinations = StringTable(1 << 16)
+        self.activities = StringTable(1 << 16)
+        super().__init__(max_size, on_full)
+
+    def _allocate(self, size):
+        return bytearray(size * self.RECORD.size)
+
+    def _encode(self, item):
+        username, phone, destination, activity, date = item
+        if not phone.isdigit() or len(phone) > 19:
+            raise ValueError(f"Phone number must be digits only: {phone!r}")
+        if not isinstance(date, Date):
+            date = Date.fromisoformat(date)
+        encoded = username.encode("utf-8")
+        if len(encoded) > 40:
+            raise ValueError(f"{username!r} is longer than 40 bytes.")
+        self.destinations.check(destination)
+        self.activities.check(activity)
+        # Destination and activity are interned in _store, once the item has been accepted
+        return (encoded, destination, activity, int(phone), len(phone), date.toordinal())
+
+    def _store(self, slot, record):
+        username, destination, activity, phone, digits, ordinal = record
+        self.RECORD.pack_into(self.queue, slot * self.RECORD.size, username, self.destinations.id_of(destination),
+                              self.activities.id_of(activity), phone, digits, ordinal)
+
+    def _load(self, slot):
+        username, destination_id, activity_id, phone, digits, ordinal = \
+            self.RECORD.unpack_from(self.queue, slot * self.RECORD.size)
+        return (username.rstrip(b"\0").decode("utf-8"), str(phone).zfill(digits),
+                self.destinations.values[destination_id], self.activities.values[activity_id],
+                Date.fromordinal(ordinal).isoformat())
+
+    def _copy_segment(self, lo, hi):
+        return [self._load(slot) for slot in range(lo, hi)]
+
+    def _grow(self):
+        # Double the buffer, copying the two ring segments once so the items start at slot 0 again
+        size = self.RECORD.size
+        old = self.queue
+        self.queue = bytearray(2 * self.max_size * size)
+        wrapped = (self.max_size - self.front) * size
+        self.queue[:wrapped] = old[self.front * size:]
+        self.queue[wrapped:self.max_size * size] = old[:self.front * size]
+        self.front = 0
+        self.rear = self.max_size - 1
+        self.max_size *= 2
+
+    def snapshot(self):
+        # One buffer copy plus the ring pointers; the destination/activity tables only ever grow, so ids stay valid
+        return bytes(self.queue), self.front, self.rear
+
+    def restore(self, snapshot):
+        buffer, self.front, self.rear = snapshot
+        self.queue = bytearray(buffer)
+        self.max_size = len(buffer) // self.RECORD.size
+
+
+# Ring buffer kept in a memory-mapped file, so queued itineraries survive the process exiting.
+# Records are fixed-width and self-contained (no string tables), and front/rear are published together
+# in one aligned 8-byte word after the record is written, so a restart resumes in O(1) without replay.
+class PersistentCircularQueue(ColumnarCircularQueue):
+    RECORD = struct.Struct("<40s16s48s32sI")  # username, phone, destination, activity (UTF-8), date ordinal
+    HEADER = struct.Struct("<4sII4x")  # magic, record size, capacity
+    STATE = struct.Struct("<q")  # (front + 1) << 32 | (rear + 1)
+    STATE_OFFSET = 16
+    DATA_OFFSET = 32
+    MAGIC = b"CQ01"
+
+    def __init__(self, path, max_size=5, on_full="reject"):
+        if on_full == "grow":
+            raise ValueError("A persistent queue has a fixed capacity; use reject or overwrite.")
+        self.file, max_size, pointers = self._open(path, max_size)
+        self.mapping = mmap.mmap(self.file.fileno(), 0)
+        super().__init__(max_size, on_full)
+        self.front, self.rear = pointers
+
+    def _open(self, path, max_size):
+        # Reuse an existing queue file (and its capacity) or create an empty one
+        if not os.path.exists(path):
+            self._create(path, max_size)
+        file = open(path, "r+b")
+        try:
+            return (file, *self._check(path, file))
+        except ValueError:
+            file.close()
+            raise
+
+    def _create(self, path, max_size):
+        # Built under a temporary name and renamed into place, so a crash never leaves a half-written file
+        if max_size < 1:
+            raise ValueError("A persistent queue needs room for at least one item.")
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.RECORD.size, max_size))
+            file.seek(self.STATE_OFFSET)
+            file.write(self.STATE.pack(0))  # Empty: front = rear = -1
+            file.truncate(self.DATA_OFFSET + max_size * self.RECORD.size)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    def _check(self, path, file):
+        # Validate the header, file size and front/rear before trusting any of them; returns (capacity, (front, rear))
+        header = file.read(self.DATA_OFFSET)
+        if len(header) < self.DATA_OFFSET:
+            raise ValueError(f"{path} is not a circular queue file.")
+        magic, record_size, capacity = self.HEADER.unpack_from(header)
+        if magic != self.MAGIC or record_size != self.RECORD.size or capacity < 1:
+            raise ValueError(f"{path} is not a circular queue file.")
+        if os.fstat(file.fileno()).st_size != self.DATA_OFFSET + capacity * self.RECORD.size:
+            raise ValueError(f"{path} does not match the size of its queue.")
+        state, = self.STATE.unpack_from(header, self.STATE_OFFSET)
+        front, rear = (state >> 32) - 1, (state & 0xFFFFFFFF) - 1
+        if not (front == rear == -1 or (0 <= front < capacity and 0 <= rear < capacity)):
+            raise ValueError(f"{path} has an invalid front/rear.")
+        return capacity, (front, rear)
+
+    def _allocate(self, size):
+        # The records area of the file; the columnar pack/unpack code works on it unchanged
+        return memoryview(self.mapping)[self.DATA_OFFSET:]
+
+    def _encode(self, item):
+        username, phone, destination, activity, date = item
+        if not isinstance(date, Date):
+            date = Date.fromisoformat(date)
+        fields = []
+        for value, width in ((username, 40), (phone, 16), (destination, 48), (activity, 32)):
+            encoded = value.encode("utf-8")
+            if len(encoded) > width:
+                raise ValueError(f"{value!r} is longer than {width} bytes.")
+            fields.append(encoded)
+        return (*fields, date.toordinal())
+
+    def _store(self, slot, record):
+        self.RECORD.pack_into(self.queue, slot * self.RECORD.size, *record)
+
+    def _load(self, slot):
+        username, phone, destination, activity, ordinal = \
+            self.RECORD.unpack_from(self.queue, slot * self.RECORD.size)
+        return (username.rstrip(b"\0").decode("utf-8"), phone.rstrip(b"\0").decode("utf-8"),
+                destination.rstrip(b"\0").decode("utf-8"), activity.rstrip(b"\0").decode("utf-8"),
+                Date.fromordinal(ordinal).isoformat())
+
+    def _grow(self):
+        raise ValueError("A persistent queue cannot grow.")
+
+    def _publish(self):
+        # One aligned 8-byte write makes the new front/rear visible together
+        self.STATE.pack_into(self.mapping, self.STATE_OFFSET, ((self.front + 1) << 32) | (self.rear + 1))
+
+    def enqueue(self, username, phone, destination, activity, date):
+        # Encode first: an item that fails validation must not cost the oldest stored record
+        record = self._encode((username, phone, destination, activity, date))
+        if self.is_full():
+            if self.on_full == "reject":
+                return False
+            self.dequeue()  # Publish dropping the oldest before its slot is reused
+        if self.front == -1:
+            self.front = self.rear = 0
+        else:
+            self.rear = (self.rear + 1) % self.max_size
+        self._store(self.rear, record)
+        self._publish()  # Only after the record itself is written
+        return True
+
+    def dequeue(self):
+        item = super().dequeue()
+        if item is not None:
+            self._publish()
+        return item
+
+    def restore(self, snapshot):
+        buffer, self.front, self.rear = snapshot
+        self.queue[:] = buffer
+        self._publish()
+
+    def flush(self):
+        # Writes already survive a process crash; flush also makes them durable across an OS crash
+        self.mapping.flush()
+
+    def close(self):
+        self.flush()
+        self.queue.release()
+        self.mapping.close()
+        self.file.close()
+
+
+# CircularQueue shared by booking intake (producer) threads and worker (consumer) threads
+class BlockingCircularQueue(CircularQueue):
+    def __init__(self, max_size=5, on_full="reject"):
+        super().__init__(max_size, on_full)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)  # Signalled when items are added
+        self.not_full = threading.Condition(self.lock)  # Signalled when items are removed
+
+    def put(self, item, timeout=None):
+        # Wait for room (forever when timeout is None); raises queue.Full if the timeout passes first
+        with self.not_full:
+            if not self.not_full.wait_for(self.has_room, timeout):
+                raise Full
+            self.enqueue(*item)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):
+        # Wait for an item (forever when timeout is None); raises queue.Empty if the timeout passes first
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.is_empty(), timeout):
+                raise Empty
+            item = self.dequeue()
+            self.not_full.notify()
+            return item
+
+    def try_put(self, item):
+        # Never blocks; returns False when the queue is full
+        with self.lock:
+            if not self.enqueue(*item):
+                return False
+            self.not_empty.notify()
+            return True
+
+    def try_get(self):
+        # Never blocks; returns None when the queue is empty
+        with self.lock:
+            item = self.dequeue()
+            if item is not None:
+                self.not_full.notify()
+            return item
+
+    def put_many(self, items, timeout=None):
+        # Add a batch under one lock acquisition, only releasing it while waiting for room.
+        # Returns how many items were added (fewer than len(items) only if the timeout passed).
+        added = 0
+        deadline = None if timeout is None else time.monotonic() + timeout  # One budget for the whole batch
+        with self.not_full:
+            while added < len(items):
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                if not self.not_full.wait_for(self.has_room, remaining):
+                    break
+                start = added
+                while added < len(items) and self.enqueue(*items[added]):
+                    added += 1
+                self.not_empty.notify(added - start)
+        return added
+
+    def get_many(self, max_items, timeout=None):
+        # Wait for at least one item, then take up to max_items under one lock acquisition
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.is_empty(), timeout):
+                return []
+            items = []
+            while len(items) < max_items and not self.is_empty():
+                items.append(self.dequeue())
+            self.not_full.notify(len(items))
+            return items
+
+
+# asyncio front-end for a CircularQueue; every call must come from the same event loop.
+# Waiters are plain futures, so moving items never involves a thread handoff.
+class AsyncCircularQueue:
+    def __init__(self, max_size=5, on_full="reject"):
+        self.ring = CircularQueue(max_size, on_full)
+        self.getters = deque()  # Futures of consumers waiting for an item
+        self.putters = deque()  # Futures of producers waiting for room (backpressure)
+
+    def put_nowait(self, item):
+        if not self.ring.enqueue(*item):
+            raise Full
+        self._wake_next(self.getters)
+
+    def get_nowait(self):
+        if self.ring.is_empty():
+            raise Empty
+        item = self.ring.dequeue()
+        self._wake_next(self.putters)
+        return item
 
+    async def put(self, item):
+        # Suspends while the queue is full
+        while not self.ring.has_room():
+            await self._wait(self.putters, self.ring.has_room)
+        self.put_nowait(item)
+
+    async def get(self):
+        # Suspends while the queue is empty
+        while self.ring.is_empty():
+            await self._wait(self.getters, lambda: not self.ring.is_empty())
+        return self.get_nowait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        # `async for item in queue` consumes items as they arrive, forever
+        return await self.get()
+
+    async def drain(self, max_items, timeout=None):
+        # Collect up to max_items, waiting at most timeout seconds in total for them to arrive.
+        # With no timeout, waits for the first item and then takes only what is already queued.
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
         items = []
-        i = self.front
-        while i != self.rear:
-            items.append(self.queue[i])
-            i = (i + 1) % self.max_size
-        items.append(self.queue[self.rear])
-        return items
+        while True:
+            while len(items) < max_items and not self.ring.is_empty():
+                items.append(self.get_nowait())
+            if len(items) >= max_items or (items and deadline is None):
+                return items
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return items
+            try:
+                await asyncio.wait_for(self._wait(self.getters, lambda: not self.ring.is_empty()), remaining)
+            except asyncio.TimeoutError:
+                return items
+
+    async def _wait(self, waiters, ready):
+        if ready():
+            return  # Can happen when wait_for starts this wait as a task after the item already arrived
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if ready() and not waiter.cancelled():
+                self._wake_next(waiters)  # We were woken but are leaving; pass the turn on
+            raise
+
+    @staticmethod
+    def _wake_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+
+def benchmark_threads(total_items=96000, max_size=1024, batch_size=64, thread_counts=(1, 2, 4, 8, 16)):
+    # Items per second through a BlockingCircularQueue with n producers and n consumers,
+    # moving items one at a time (put/get) and in batches (put_many/get_many)
+    item = ("Passenger", "0780000000", "Lake Kivu", "Swimming", "2025-01-10")
+
+    def shares(count):
+        return [total_items // count + (1 if i < total_items % count else 0) for i in range(count)]
+
+    def produce(queue, count, batched):
+        if batched:
+            batch = [item] * batch_size
+            while count > 0:
+                count -= queue.put_many(batch[:min(batch_size, count)])
+        else:
+            for _ in range(count):
+                queue.put(item)
 
+    def consume(queue, count, batched):
+        while count > 0:
+            if batched:
+                count -= len(queue.get_many(min(batch_size, count)))
+            else:
+                queue.get()
+                count -= 1
+
+    for threads in thread_counts:
+        results = []
+        for batched in (False, True):
+            queue = BlockingCircularQueue(max_size)
+            workers = [threading.Thread(target=produce, args=(queue, count, batched)) for count in shares(threads)]
+            workers += [threading.Thread(target=consume, args=(queue, count, batched)) for count in shares(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            results.append(total_items / (time.perf_counter() - start))
+        print(f"{threads:>2} producers / {threads:>2} consumers: "
+              f"put/get {results[0]:>10,.0f} items/s, put_many/get_many {results[1]:>10,.0f} items/s")
+
+
+# The app's queue file lives next to this script, whatever the working directory is
+QUEUE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "itinerary_queue.bin")
 
 # Main Travel Itinerary App
 class TravelItineraryApp:
@@ -57,9 +561,18 @@ class TravelItineraryApp:
         self.root.title("Travel Itinerary Planner")
         self.root.state("zoomed")  # Make the window maximized
 
-        self.itinerary_manager = CircularQueue(max_size=5)  # Fixed size of 5 orders
+        # Keeps the 5 latest orders in a file next to the app, so they are still there after a restart
+        try:
+            self.itinerary_manager = PersistentCircularQueue(QUEUE_FILE, max_size=5, on_full="overwrite")
+        except ValueError as error:
+            # Keep the unreadable file for inspection and start again with an empty queue
+            os.replace(QUEUE_FILE, QUEUE_FILE + ".bad")
+            messagebox.showerror("Saved Orders Unreadable",
+                                 f"{error}\nIt was moved to {QUEUE_FILE}.bad and a new, empty queue was started.")
+            self.itinerary_manager = PersistentCircularQueue(QUEUE_FILE, max_size=5, on_full="overwrite")
 
         self.create_widgets()
+        self.update_table()  # Show the orders restored from the previous run
 
     def create_widgets(self):
         # Title
@@ -183,13 +696,11 @@ class TravelItineraryApp:
             messagebox.showerror("Input Error", "Please fill in all fields!")
             return
 
-        if not self.itinerary_manager.enqueue(username, phone, destination, activity, date):
-            response = messagebox.askyesno("Queue Full", "The itinerary is full. Remove the oldest entry?")
-            if response:
-                self.itinerary_manager.dequeue()
-                self.itinerary_manager.enqueue(username, phone, destination, activity, date)
-            else:
-                return
+        try:
+            self.itinerary_manager.enqueue(username, phone, destination, activity, date)  # Replaces the oldest when full
+        except ValueError as error:
+            messagebox.showerror("Input Error", str(error))
+            return
 
         self.update_table()
         self.clear_fields()
@@ -206,7 +717,7 @@ class TravelItineraryApp:
         for row in self.tree.get_children():
             self.tree.delete(row)
 
-        for entry in self.itinerary_manager.display():
+        for entry in self.itinerary_manager:
             self.tree.insert("", "end", values=entry)
 
     def clear_fields(self):
@@ -218,6 +729,9 @@ class TravelItineraryApp:
 
 # Run the App
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = TravelItineraryApp(root)
-    root.mainloop()
+    if "--benchmark" in sys.argv:
+        benchmark_threads()
+    else:
+        root = tk.Tk()
+        app = TravelItineraryApp(root)
+        root.mainloop()
@@ -1,43 +1,226 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from collections import deque  # Queue for breadth-first traversal
+from itertools import islice  # Takes one chunk of rows at a time from a traversal
 
 # TreeNode class to represent each node in the tree
 class TreeNode:
     def __init__(self, name):
         self.name = name
-        self.children = []
+        # Dicts are used as insertion-ordered sets, so lookups and removals are O(1)
+        self.children = {}  # Child nodes, in the order they were added
+        self.children_by_name = {}  # name -> children with that name, oldest first
 
     def add_child(self, node):
-        self.children.append(node)
+        self.children[node] = None
+        self.children_by_name.setdefault(node.name, {})[node] = None
 
     def remove_child(self, node):
         if node in self.children:
-            self.children.remove(node)
+            del self.children[node]
+            siblings = self.children_by_name[node.name]
+            del siblings[node]
+            if not siblings:
+                del self.children_by_name[node.name]
+
+    def get_child(self, name):
+        # The oldest child with this name, or None
+        siblings = self.children_by_name.get(name)
+        return next(iter(siblings)) if siblings else None
+
+    def get_children(self, name):
+        return list(self.children_by_name.get(name, ()))
+
+    def reorder_children(self, ordered):
+        # Replace the child order (e.g. after sorting) with the same children in a new order
+        self.children = dict.fromkeys(ordered)
+        self.children_by_name = {}
+        for node in ordered:
+            self.children_by_name.setdefault(node.name, {})[node] = None
+
+    def resolve(self, names):
+        # Follow a sequence of child names down from this node in O(depth); None if any step is missing
+        node = self
+        for name in names:
+            node = node.get_child(name)
+            if node is None:
+                return None
+        return node
+
+    # Iterative traversals yielding (depth, node); no recursion, so any depth is safe
+    def preorder(self):
+        stack = [(0, self)]
+        while stack:
+            depth, node = stack.pop()
+            yield depth, node
+            stack.extend((depth + 1, child) for child in reversed(node.children))
+
+    def postorder(self):
+        stack = [(0, self, False)]
+        while stack:
+            depth, node, children_done = stack.pop()
+            if children_done:
+                yield depth, node
+            else:
+                stack.append((depth, node, True))
+                stack.extend((depth + 1, child, False) for child in reversed(node.children))
+
+    def bfs(self):
+        queue = deque([(0, self)])
+        while queue:
+            depth, node = queue.popleft()
+            yield depth, node
+            queue.extend((depth + 1, child) for child in node.children)
 
     def __str__(self):
         return self.name
 
+# Hierarchy of any depth addressed by paths like "Rwanda/Musanze/Volcanoes National Park/Hiking"
+class ItineraryTree:
+    SEPARATOR = "/"
+
+    def __init__(self, name="Travel Itinerary", indexed=False):
+        self.root = TreeNode(name)
+        # Optional path -> node index for O(1) resolution. It stays exact as long as the tree is only
+        # changed through insert_path/remove_path, which never create two siblings with the same name.
+        self.index = {} if indexed else None
+
+    def split(self, path):
+        return [name for name in path.split(self.SEPARATOR) if name]
+
+    def get(self, path):
+        names = self.split(path)
+        if not names:
+            return self.root
+        if self.index is not None:
+            return self.index.get(self.SEPARATOR.join(names))
+        return self.root.resolve(names)
+
+    def insert_path(self, path):
+        # Create whatever part of the path is missing and return the node at its end
+        node = self.root
+        names = self.split(path)
+        for depth, name in enumerate(names):
+            child = node.get_child(name)
+            if child is None:
+                child = TreeNode(name)
+                node.add_child(child)
+                if self.index is not None:
+                    self.index[self.SEPARATOR.join(names[:depth + 1])] = child
+            node = child
+        return node
+
+    def remove_path(self, path):
+        # Detach the node at path (with its subtree) and return it, or None if there is no such node
+        names = self.split(path)
+        if not names:
+            return None
+        parent = self.root.resolve(names[:-1])
+        node = parent.get_child(names[-1]) if parent else None
+        if node is None:
+            return None
+        parent.remove_child(node)
+        if self.index is not None:
+            # Forget every path under the removed subtree
+            stack = [(self.SEPARATOR.join(names), node)]
+            while stack:
+                node_path, current = stack.pop()
+                self.index.pop(node_path, None)
+                for child in current.children:
+                    stack.append((node_path + self.SEPARATOR + child.name, child))
+        return node
+
+# ttk.Treeview over a TreeNode hierarchy that only creates items for nodes whose parent is expanded
+class LazyTreeView:
+    PLACEHOLDER = "placeholder"  # Tag of the dummy child that gives a collapsed node its expand arrow
+
+    def __init__(self, treeview, root_node):
+        self.treeview = treeview
+        self.root_node = root_node
+        self.item_ids = {}  # node -> Treeview item, only for nodes currently in the Treeview
+        self.nodes = {}  # Treeview item -> node
+        self.loaded = set()  # Items whose real children have been inserted
+        treeview.bind("<<TreeviewOpen>>", self.on_open)
+        self.refresh()
+
+    def refresh(self):
+        # Start over with only the root node (collapsed)
+        self.treeview.delete(*self.treeview.get_children())
+        self.item_ids.clear()
+        self.nodes.clear()
+        self.loaded.clear()
+        self._insert_item("", self.root_node)
+
+    def on_open(self, event=None):
+        self.expand(self.nodes.get(self.treeview.focus()))
+
+    def expand(self, node):
+        # Materialize the children of a node that is already shown, the first time it is opened
+        item = self.item_ids.get(node)
+        if item is None or item in self.loaded:
+            return
+        self.loaded.add(item)
+        self.treeview.delete(*self.treeview.get_children(item))  # Drop the placeholder
+        for child in node.children:
+            self._insert_item(item, child)
+
+    def child_added(self, parent, child):
+        # Reflect parent.add_child(child) by touching at most one item
+        item = self.item_ids.get(parent)
+        if item is None:
+            return  # Parent not on screen
+        if item in self.loaded:
+            self._insert_item(item, child)
+        elif not self.treeview.get_children(item):
+            self._insert_placeholder(item)
+
+    def child_removed(self, parent, child):
+        # Reflect parent.remove_child(child): delete its item (if shown) and forget its shown subtree
+        item = self.item_ids.get(child)
+        if item is not None:
+            stack = [item]
+            while stack:
+                current = stack.pop()
+                stack.extend(self.treeview.get_children(current))
+                node = self.nodes.pop(current, None)
+                if node is not None:
+                    del self.item_ids[node]
+                self.loaded.discard(current)
+            self.treeview.delete(item)
+        parent_item = self.item_ids.get(parent)
+        if parent_item is not None and parent_item not in self.loaded and not parent.children:
+            self.treeview.delete(*self.treeview.get_children(parent_item))
+
+    def _insert_item(self, parent_item, node):
+        item = self.treeview.insert(parent_item, "end", text=node.name)
+        self.item_ids[node] = item
+        self.nodes[item] = node
+        if node.children:
+            self._insert_placeholder(item)
+        return item
+
+    def _insert_placeholder(self, item):
+        self.treeview.insert(item, "end", text="...", tags=(self.PLACEHOLDER,))
+
 # Travel itinerary app class with tree structure integration
 class TravelItineraryApp:
+    RENDER_CHUNK = 500  # Rows inserted per Tk event-loop turn while displaying the tree
+
     def __init__(self, root):
         self.root = root
+        self.render_job = None  # Pending after() call of an unfinished display_tree
         self.root.title("Travel Itinerary Planner")
         self.root.state("zoomed")  # Maximize the window at startup
 
         # Initialize the root of the tree (main destination)
-        self.root_node = TreeNode("Travel Itinerary")
-
-        # Predefined destinations
-        self.volcanoes_node = TreeNode("Volcanoes National Park")
-        self.nyungwe_node = TreeNode("Nyungwe Forest National Park")
-        self.kivu_node = TreeNode("Lake Kivu")
-        self.akagera_node = TreeNode("Akagera National Park")
+        self.tree = ItineraryTree("Travel Itinerary")
+        self.root_node = self.tree.root
 
-        # Add predefined destinations to the root node
-        self.root_node.add_child(self.volcanoes_node)
-        self.root_node.add_child(self.nyungwe_node)
-        self.root_node.add_child(self.kivu_node)
-        self.root_node.add_child(self.akagera_node)
+        # Predefined destinations, added under the root node
+        self.volcanoes_node = self.tree.insert_path("Volcanoes National Park")
+        self.nyungwe_node = self.tree.insert_path("Nyungwe Forest National Park")
+        self.kivu_node = self.tree.insert_path("Lake Kivu")
+        self.akagera_node = self.tree.insert_path("Akagera National Park")
 
         # Set up the UI components
         self.create_widgets()
@@ -80,6 +263,12 @@ class TravelItineraryApp:
         self.itinerary_listbox = tk.Listbox(self.root, height=20, width=80, font=("Helvetica", 18))
         self.itinerary_listbox.grid(row=4, column=0, columnspan=2, pady=20)
 
+        # Expandable view of the hierarchy; children are only created when their parent is opened
+        self.hierarchy_treeview = ttk.Treeview(self.root, height=20)
+        self.hierarchy_treeview.heading("#0", text="Itinerary Hierarchy")
+        self.hierarchy_treeview.grid(row=4, column=2, padx=10, pady=20, sticky="ns")
+        self.hierarchy_view = LazyTreeView(self.hierarchy_treeview, self.root_node)
+
         # Display tree button
         self.display_tree_button = tk.Button(self.root, text="Display Tree", font=("Helvetica", 20), bg="#3498db", fg="white", command=self.display_tree)
         self.display_tree_button.grid(row=5, column=0, columnspan=2, pady=20)
@@ -97,9 +286,9 @@ class TravelItineraryApp:
         # Add the activity as a child of the destination node
         new_activity_node = TreeNode(activity)
         destination_node.add_child(new_activity_node)
+        self.hierarchy_view.child_added(destination_node, new_activity_node)
 
         messagebox.showinfo("Success", f"Activity '{activity}' added to {destination}.")
-        self.display_tree()
 
     def remove_itinerary(self):
         destination = self.destination_var.get()
@@ -119,32 +308,39 @@ class TravelItineraryApp:
 
         # Remove the activity node from the destination
         destination_node.remove_child(activity_node)
+        self.hierarchy_view.child_removed(destination_node, activity_node)
 
         messagebox.showinfo("Success", f"Activity '{activity}' removed from {destination}.")
-        self.display_tree()
 
     def get_destination_node(self, name):
-        for child in self.root_node.children:
-            if child.name == name:
-                return child
-        return None
+        # Destinations are the root's direct children; a name is never treated as a path here
+        return self.root_node.get_child(name)
 
     def get_activity_node(self, destination_node, name):
-        for child in destination_node.children:
-            if child.name == name:
-                return child
-        return None
+        return destination_node.get_child(name)
 
     def display_tree(self):
+        # Restart rendering from the top; rows are added a chunk at a time so the window stays responsive
+        if self.render_job is not None:
+            self.root.after_cancel(self.render_job)
+            self.render_job = None
         self.itinerary_listbox.delete(0, tk.END)
-
-        def traverse_tree(node, level=0):
-            indentation = " " * (level * 4)
-            self.itinerary_listbox.insert(tk.END, f"{indentation}{node.name}")
-            for child in node.children:
-                traverse_tree(child, level + 1)
-
-        traverse_tree(self.root_node)
+        self.render_nodes = self.root_node.preorder()
+        self.indentations = []  # depth -> indentation string, built once per depth
+        self.render_chunk()
+
+    def render_chunk(self):
+        rows = []
+        for depth, node in islice(self.render_nodes, self.RENDER_CHUNK):
+            while len(self.indentations) <= depth:
+                self.indentations.append(" " * (len(self.indentations) * 4))
+            rows.append(self.indentations[depth] + node.name)
+        if rows:
+            self.itinerary_listbox.insert(tk.END, *rows)
+        if len(rows) == self.RENDER_CHUNK:
+            self.render_job = self.root.after(1, self.render_chunk)  # More to come after Tk handles events
+        else:
+            self.render_job = None
 
 # Run the app
 if __name__ == "__main__":
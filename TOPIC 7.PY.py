@@ -6,14 +6,89 @@ from tkinter import ttk
 class TreeNode:
     def __init__(self, name):
         self.name = name
-        self.children = []  # Activities under this destination
+        # Dicts are used as insertion-ordered sets, so lookups and removals are O(1)
+        self.children = {}  # Activities under this destination
+        self.children_by_name = {}  # name -> children with that name, oldest first
+        self.parent = None
+        # Aggregates over everything below this node, kept up to date on add/remove
+        self.descendant_count = 0
+        self._min_priority = None  # None while there are no activities below
+        self._max_priority = None
+        self.priorities_dirty = False  # Set when a removal took away the min or max; recomputed on read
+
+    @property
+    def min_priority(self):
+        if self.priorities_dirty:
+            self._recompute_priorities()
+        return self._min_priority
+
+    @property
+    def max_priority(self):
+        if self.priorities_dirty:
+            self._recompute_priorities()
+        return self._max_priority
+
+    def _recompute_priorities(self):
+        # Rebuild min/max from the children's cached aggregates (only after a removal)
+        lows, highs = [], []
+        for child in self.children:
+            _, low, high = subtree_stats(child)
+            if low is not None:
+                lows.append(low)
+                highs.append(high)
+        self._min_priority = min(lows, default=None)
+        self._max_priority = max(highs, default=None)
+        self.priorities_dirty = False
 
     def add_child(self, node):
-        self.children.append(node)
+        self.children[node] = None
+        self.children_by_name.setdefault(node.name, {})[node] = None
+        if isinstance(node, TreeNode):
+            node.parent = self
+        # Walk up to the root once, folding the new subtree into each ancestor
+        count, low, high = subtree_stats(node)
+        ancestor = self
+        while ancestor is not None:
+            ancestor.descendant_count += count
+            if low is not None and not ancestor.priorities_dirty:
+                if ancestor._min_priority is None or low < ancestor._min_priority:
+                    ancestor._min_priority = low
+                if ancestor._max_priority is None or high > ancestor._max_priority:
+                    ancestor._max_priority = high
+            ancestor = ancestor.parent
 
     def remove_child(self, node):
         if node in self.children:
-            self.children.remove(node)
+            del self.children[node]
+            siblings = self.children_by_name[node.name]
+            del siblings[node]
+            if not siblings:
+                del self.children_by_name[node.name]
+            count, low, high = subtree_stats(node)
+            if isinstance(node, TreeNode):
+                node.parent = None
+            # Counts are exact; min/max are only marked dirty where the removed subtree held them
+            ancestor = self
+            while ancestor is not None:
+                ancestor.descendant_count -= count
+                if low is not None and (low == ancestor._min_priority or high == ancestor._max_priority):
+                    ancestor.priorities_dirty = True
+                ancestor = ancestor.parent
+
+    def get_child(self, name):
+        # The oldest child with this name, or None
+        siblings = self.children_by_name.get(name)
+        return next(iter(siblings)) if siblings else None
+
+    def get_children(self, name):
+        return list(self.children_by_name.get(name, ()))
+
+    def reorder_children(self, ordered):
+        # Replace the child order (e.g. after sorting) with the same children in a new order
+        self.children = dict.fromkeys(ordered)
+        self.children_by_name = {}
+        for node in ordered:
+            self.children_by_name.setdefault(node.name, {})[node] = None
 
     def __str__(self):
         return self.name
@@ -27,6 +102,12 @@ class Activity:
     def __str__(self):
         return f"{self.name} (Priority: {self.priority})"
 
+def subtree_stats(node):
+    # (nodes in the subtree including node, min priority, max priority) in O(1)
+    if isinstance(node, TreeNode):
+        return 1 + node.descendant_count, node.min_priority, node.max_priority
+    return 1, node.priority, node.priority
+
 # Travel itinerary app class with tree structure integration
 class TravelItineraryApp:
     def __init__(self, root):
@@ -201,18 +282,12 @@ class TravelItineraryApp:
         self.display_tree()  # Update the tree display
 
     def get_destination_node(self, name):
-        # Traverse the root node's children to find the matching destination node
-        for child in self.root_node.children:
-            if child.name == name:
-                return child
-        return None
+        # Hashed lookup among the root node's children
+        return self.root_node.get_child(name)
 
     def get_activity_node(self, destination_node, name):
-        # Traverse the destination node's children to find the matching activity node
-        for child in destination_node.children:
-            if child.name == name:
-                return child
-        return None
+        # Hashed lookup among the destination node's children
+        return destination_node.get_child(name)
 
     def display_tree(self):
         # Show the current hierarchy in the tree structure
@@ -235,13 +310,14 @@ class TravelItineraryApp:
     def sort_by_priority(self):
         # Sort the activities under each destination by their priority using Counting Sort
         for destination_node in self.root_node.children:
-            destination_node.children = self.counting_sort_activities(destination_node.children)
+            if destination_node.max_priority is None:
+                continue  # No activities to sort
+            destination_node.reorder_children(self.counting_sort_activities(destination_node.children, destination_node.max_priority))
         
         self.display_tree()  # Update the tree display after sorting
 
-    def counting_sort_activities(self, activities):
-        # Find the maximum priority value to set the range of counts
-        max_priority = max(activity.priority for activity in activities)
+    def counting_sort_activities(self, activities, max_priority):
+        # max_priority (cached on the destination node) sets the range of counts
         count = [0] * (max_priority + 1)  # Counting array for priorities
         output = [None] * len(activities)
 
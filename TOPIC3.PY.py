@@ -1,27 +1,137 @@
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
+from bisect import bisect_left, insort  # For the date-ordered index
+from datetime import date as Date, datetime
+
+def parse_date(value):
+    # Accept a date object or a "YYYY-MM-DD" string; raises ValueError for anything else
+    if isinstance(value, Date):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"Expected a date or a YYYY-MM-DD string, got {value!r}.")
+    return datetime.strptime(value.strip(), "%Y-%m-%d").date()
 
 # Define the Itinerary Item class
 class ItineraryItem:
     def __init__(self, destination, activity, date):
+        parsed = parse_date(date)  # Validate on ingest
         self.destination = destination
         self.activity = activity
-        self.date = date
+        self.date = parsed.isoformat()
+        self.ordinal = parsed.toordinal()  # Day number used for ordering and range scans
+        self.label = f"{self.activity} in {self.destination} on {self.date}"  # Built once, reused by every refresh
 
     def __str__(self):
-        return f"{self.activity} in {self.destination} on {self.date}"
+        return self.label
 
 # Define the Travel Itinerary class to manage the list
 class TravelItinerary:
     def __init__(self):
-        self.itinerary = []  # List to hold itinerary items
+        # Dicts are used as insertion-ordered sets so any item can be removed in O(1)
+        self.itinerary = {}  # Itinerary items, in the order they were added -> their date-order key
+        self.date_order = []  # (ordinal, sequence, item) kept sorted with bisect
+        self.sequence = 0  # Tie-breaker so items on the same day keep their add order
+        self.live = [0]  # Fenwick tree over sequence numbers (1 while that item is still listed), for O(log n) positions
+        self.by_activity = {}  # activity -> items with that activity
+        self.by_destination = {}  # destination -> items at that destination
+        self.by_date = {}  # date -> items on that date
+        self.listeners = []  # Callbacks called as listener(event, index, item) on every change
+
+    def subscribe(self, listener):
+        # listener is called with ("inserted" | "removed", position in add order, item)
+        self.listeners.append(listener)
+
+    def _notify(self, event, index, item):
+        for listener in self.listeners:
+            listener(event, index, item)
+
+    def _mark_added(self):
+        # Append a 1 for the newest sequence number; each Fenwick cell sums the range it covers
+        i = len(self.live)
+        self.live.append(1 + self._count_before(i - 1) - self._count_before(i - (i & -i)))
+
+    def _mark_removed(self, sequence):
+        i = sequence + 1
+        while i < len(self.live):
+            self.live[i] -= 1
+            i += i & -i
+
+    def _compact(self):
+        # Renumber the listed items 0..n-1 in add order and rebuild the Fenwick tree without dead slots.
+        # Relative order is unchanged, so date_order stays sorted.
+        self.itinerary = {item: (key[0], sequence) for sequence, (item, key) in enumerate(self.itinerary.items())}
+        self.date_order = [self.itinerary[entry[2]] + (entry[2],) for entry in self.date_order]
+        self.sequence = len(self.itinerary)
+        self.live = [0] + [1] * self.sequence
+        for i in range(1, self.sequence + 1):  # Linear-time Fenwick build
+            parent = i + (i & -i)
+            if parent <= self.sequence:
+                self.live[parent] += self.live[i]
+
+    def _count_before(self, sequence):
+        # Number of listed items added before this sequence number, i.e. its position in add order
+        total = 0
+        i = sequence
+        while i > 0:
+            total += self.live[i]
+            i -= i & -i
+        return total
+
+    def _indexes(self, item):
+        return ((self.by_activity, item.activity), (self.by_destination, item.destination), (self.by_date, item.date))
 
     def add_itinerary_item(self, item):
-        self.itinerary.append(item)
+        order_key = (item.ordinal, self.sequence)
+        self.sequence += 1
+        self._mark_added()
+        self.itinerary[item] = order_key
+        insort(self.date_order, order_key + (item,))
+        for index, key in self._indexes(item):
+            index.setdefault(key, {})[item] = None
+        if self.listeners:
+            self._notify("inserted", len(self.itinerary) - 1, item)
+
+    def remove_item(self, item):
+        # Remove one specific item from the list and every index
+        order_key = self.itinerary.pop(item)
+        position = self._count_before(order_key[1])
+        self._mark_removed(order_key[1])
+        del self.date_order[bisect_left(self.date_order, order_key)]
+        for index, key in self._indexes(item):
+            bucket = index[key]
+            del bucket[item]
+            if not bucket:
+                del index[key]
+        if len(self.live) > 64 and len(self.live) - 1 > 3 * len(self.itinerary):
+            self._compact()  # Dead slots outnumber live items more than 2 to 1
+        if self.listeners:
+            self._notify("removed", position, item)
 
     def remove_itinerary_item(self, activity):
-        self.itinerary = [item for item in self.itinerary if item.activity != activity]
+        # Remove every item with this activity, touching only those items
+        for item in list(self.by_activity.get(activity, ())):
+            self.remove_item(item)
+
+    def items_by_activity(self, activity):
+        return list(self.by_activity.get(activity, ()))
+
+    def items_by_destination(self, destination):
+        return list(self.by_destination.get(destination, ()))
+
+    def items_on_date(self, date):
+        return list(self.by_date.get(parse_date(date).isoformat(), ()))
+
+    def items_between(self, start, end):
+        # Items dated from start to end inclusive, in date order, in O(log n + k)
+        lo = bisect_left(self.date_order, (parse_date(start).toordinal(),))
+        hi = bisect_left(self.date_order, (parse_date(end).toordinal() + 1,))
+        return [entry[2] for entry in self.date_order[lo:hi]]
+
+    def next_n(self, after_date, n):
+        # The first n items dated strictly after after_date, in date order
+        lo = bisect_left(self.date_order, (parse_date(after_date).toordinal() + 1,))
+        return [entry[2] for entry in self.date_order[lo:lo + n]]
 
     def get_itinerary_items(self):
         return [str(item) for item in self.itinerary]
@@ -33,6 +143,8 @@ class TravelItineraryApp:
         self.root.title("Travel Itinerary Planner")
         self.root.state("zoomed")  # Maximize the window at startup
         self.itinerary_manager = TravelItinerary()
+        self.itinerary_manager.subscribe(self.on_itinerary_change)
+        self.listbox_live = False  # After the first View Itinerary, the listbox follows changes itself
         
         # Set up the UI components
         self.create_widgets()
@@ -124,7 +236,11 @@ class TravelItineraryApp:
             date = self.custom_date_entry.get()  # Use custom date if selected
 
         # Create itinerary item and add to the manager
-        new_item = ItineraryItem(destination, activity, date)
+        try:
+            new_item = ItineraryItem(destination, activity, date)
+        except ValueError:
+            messagebox.showerror("Invalid Date", "Please select a date or enter one as YYYY-MM-DD.")
+            return
         self.itinerary_manager.add_itinerary_item(new_item)
 
         # Clear the entries
@@ -136,10 +252,21 @@ class TravelItineraryApp:
         messagebox.showinfo("Itinerary Added", "Your itinerary item has been added successfully!")
 
     def view_itinerary(self):
-        # Clear the listbox and show updated itinerary items
+        # Paint the listbox once; later changes arrive as single-row deltas
+        if self.listbox_live:
+            return
         self.itinerary_listbox.delete(0, tk.END)
-        for item in self.itinerary_manager.get_itinerary_items():
-            self.itinerary_listbox.insert(tk.END, item)
+        self.itinerary_listbox.insert(tk.END, *self.itinerary_manager.get_itinerary_items())
+        self.listbox_live = True
+
+    def on_itinerary_change(self, event, index, item):
+        # Apply one insert/remove to the listbox instead of repainting every row
+        if not self.listbox_live:
+            return
+        if event == "inserted":
+            self.itinerary_listbox.insert(index, str(item))
+        elif event == "removed":
+            self.itinerary_listbox.delete(index)
 
     def remove_itinerary(self):
         selected_item_index = self.itinerary_listbox.curselection()
@@ -148,11 +275,8 @@ class TravelItineraryApp:
             # Extract activity name from the selected item string
             activity_name = selected_item_text.split(" in ")[0]  # Get the activity name part
 
-            # Remove the item from the itinerary manager
+            # Remove the item from the itinerary manager (the listbox is updated through change events)
             self.itinerary_manager.remove_itinerary_item(activity_name)
-
-            # Refresh the listbox
-            self.view_itinerary()
             messagebox.showinfo("Itinerary Removed", f"The activity '{activity_name}' has been removed.")
         else:
             messagebox.showwarning("No Selection", "Please select an activity to remove.")
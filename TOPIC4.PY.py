@@ -1,11 +1,34 @@
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk  # Import ttk for Treeview
+import time  # Clock for OrderCache expiry and operation timings
+import logging  # Optional DEBUG tracing of list operations
+from bisect import bisect_left  # For latency histogram buckets
+
+logger = logging.getLogger(__name__)
+
+# Counters and latency histograms for DoublyLinkedList operations, only created on demand
+class OrderListInstrumentation:
+    BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1)  # Histogram upper bounds in seconds, plus one overflow bucket
+
+    def __init__(self, callback=None):
+        self.callback = callback  # Called as callback(operation, seconds, result)
+        self.counts = {}  # operation -> number of calls
+        self.histograms = {}  # operation -> calls per latency bucket
+
+    def record(self, operation, seconds, result):
+        self.counts[operation] = self.counts.get(operation, 0) + 1
+        histogram = self.histograms.setdefault(operation, [0] * (len(self.BUCKETS) + 1))
+        histogram[bisect_left(self.BUCKETS, seconds)] += 1
+        logger.debug("%s took %.6fs -> %r", operation, seconds, result)
+        if self.callback is not None:
+            self.callback(operation, seconds, result)
 
 # Doubly Linked List to manage orders
 class DoublyLinkedList:
     class Node:
-        def __init__(self, destination, activity, username, phone):
+        def __init__(self, order_id, destination, activity, username, phone):
+            self.order_id = order_id
             self.destination = destination
             self.activity = activity
             self.username = username
@@ -18,57 +41,376 @@ class DoublyLinkedList:
         self.tail = None
         self.size = 0
         self.max_size = max_size
+        self.next_order_id = 1  # Order ids start at 1 so a returned id is always truthy
+        self.nodes = {}  # order_id -> Node
+        self.by_key = {}  # (destination, activity) -> {order_id: Node}, oldest first
+        self.instrumentation = None  # OrderListInstrumentation while enable_instrumentation is active
+        self.listeners = []  # Callbacks called as listener(event, node) when nodes join or leave the list
+
+    def subscribe(self, listener):
+        # listener(event, node): "linked" right after a node joins, "unlinking" right before it leaves
+        self.listeners.append(listener)
+
+    def _notify(self, event, node):
+        for listener in self.listeners:
+            listener(event, node)
+
+    def enable_instrumentation(self, callback=None):
+        # Wraps the hot-path methods on this instance only, so a list that is not traced runs them untouched
+        self.disable_instrumentation()  # Enabling twice replaces the wrappers instead of stacking them
+        self.instrumentation = OrderListInstrumentation(callback)
+        self.insert_order = self._timed("insert", self.insert_order)
+        self.remove_order_id = self._timed("remove", self.remove_order_id)
+        self.iter_orders = self._timed_traversal(self.iter_orders)
+        return self.instrumentation
+
+    def disable_instrumentation(self):
+        for name in ("insert_order", "remove_order_id", "iter_orders"):
+            self.__dict__.pop(name, None)
+        self.instrumentation = None
+
+    def _timed(self, operation, method):
+        record = self.instrumentation.record
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            record(operation, time.perf_counter() - start, result)
+            return result
+        return timed
+
+    def _timed_traversal(self, method):
+        record = self.instrumentation.record
+
+        def timed():
+            # Time the whole walk, which ends when the caller has consumed every node
+            start = time.perf_counter()
+            count = 0
+            for node in method():
+                count += 1
+                yield node
+            record("traverse", time.perf_counter() - start, count)
+        return timed
 
     def insert_order(self, destination, activity, username, phone):
+        # Returns the new order id, or False when the list is full
         if self.size == self.max_size:
-            print("Maximum order limit reached. Cannot add more orders.")
             return False  # No space for new orders
 
-        new_node = self.Node(destination, activity, username, phone)
+        new_node = self._new_node(destination, activity, username, phone)
+        self._add_node(new_node)
+        return new_node.order_id
 
-        if self.tail is None:  # Empty list
-            self.head = new_node
-            self.tail = new_node
-        else:
-            self.tail.next = new_node
-            new_node.prev = self.tail
-            self.tail = new_node
+    def _new_node(self, destination, activity, username, phone):
+        # Hook for subclasses with their own node type
+        node = self.Node(self.next_order_id, destination, activity, username, phone)
+        self.next_order_id += 1
+        return node
 
+    def _add_node(self, node):
+        self._link_back(node)
+        self.nodes[node.order_id] = node
+        self._index(node)
         self.size += 1
-        print(f"Order added: {destination} - {activity}")
-        return True
+
+    def _index(self, node):
+        self.by_key.setdefault((node.destination, node.activity), {})[node.order_id] = node
+
+    def _unindex(self, node):
+        key = (node.destination, node.activity)
+        del self.by_key[key][node.order_id]
+        if not self.by_key[key]:
+            del self.by_key[key]
 
     def remove_order(self, destination, activity):
+        # Removes the oldest order for this destination/activity; use remove_order_id for a specific one
+        matches = self.by_key.get((destination, activity))
+        if not matches:
+            return False
+        return self.remove_order_id(next(iter(matches)))
+
+    def remove_order_id(self, order_id):
+        node = self.nodes.pop(order_id, None)
+        if node is None:
+            return False
+
+        self._unlink(node)
+        self._unindex(node)
+        self.size -= 1
+        return True
+
+    def iter_orders(self):
+        # Walk the orders from head to tail
         current = self.head
         while current:
-            if current.destination == destination and current.activity == activity:
-                if current.prev:
-                    current.prev.next = current.next
-                if current.next:
-                    current.next.prev = current.prev
-                if current == self.head:  # Removing the head
-                    self.head = current.next
-                if current == self.tail:  # Removing the tail
-                    self.tail = current.prev
-                self.size -= 1
-                print(f"Order removed: {destination} - {activity}")
-                return True
+            yield current
             current = current.next
 
-        print("Order not found.")
-        return False
+    def get_order(self, order_id):
+        return self.nodes.get(order_id)
+
+    def find_orders(self, destination, activity):
+        # Every order for this destination/activity, oldest first
+        return list(self.by_key.get((destination, activity), {}).values())
+
+    def move_to_front(self, order_id):
+        node = self.nodes[order_id]
+        if node is not self.head:
+            self._unlink(node)
+            self._link_front(node)
+
+    def move_to_back(self, order_id):
+        node = self.nodes[order_id]
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_back(node)
+
+    def _link_back(self, node):
+        node.prev = self.tail
+        node.next = None
+        if self.tail is None:  # Empty list
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        if self.listeners:
+            self._notify("linked", node)
+
+    def _link_front(self, node):
+        node.prev = None
+        node.next = self.head
+        if self.head is None:  # Empty list
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+        if self.listeners:
+            self._notify("linked", node)
+
+    def _unlink(self, node):
+        if self.listeners:
+            self._notify("unlinking", node)
+        if node.prev:
+            node.prev.next = node.next
+        else:  # Removing the head
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:  # Removing the tail
+            self.tail = node.prev
+        node.prev = node.next = None
 
     def is_full(self):
         return self.size == self.max_size
 
 
+# Cache of orders built on the linked list: evicts from the head instead of refusing new orders
+class OrderCache(DoublyLinkedList):
+    POLICIES = ("lru", "fifo", "ttl")
+    NO_KEY = object()  # Key of orders added through insert_order rather than put
+
+    class Node(DoublyLinkedList.Node):
+        # Adds the expiry time, and the key/value of entries added through put
+        def __init__(self, order_id, destination, activity, username, phone):
+            super().__init__(order_id, destination, activity, username, phone)
+            self.expires_at = None
+            self.key = OrderCache.NO_KEY
+            self.value = None
+
+    def __init__(self, max_size, policy="lru", ttl=None, clock=time.monotonic):
+        # lru: get/touch move an order to the back; fifo: insertion order only;
+        # ttl: orders expire ttl seconds after insertion (touch renews them)
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        if policy == "ttl" and ttl is None:
+            raise ValueError("The ttl policy needs a ttl in seconds.")
+        if max_size < 1:
+            raise ValueError("The cache needs room for at least one entry.")
+        super().__init__(max_size)
+        self.policy = policy
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = {}  # Caller's key -> Node, for put/get/touch
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def insert_order(self, destination, activity, username, phone):
+        # Never refuses: when full, the order at the head is evicted first
+        self._make_room()
+        return super().insert_order(destination, activity, username, phone)
+
+    def put(self, key, value):
+        # Cache value under key, replacing any value already there; returns the entry's order id
+        node = self._lookup(key)
+        if node is None:
+            self._make_room()
+            node = self._new_node(None, None, None, None)
+            node.key = key
+            self._add_node(node)
+        elif self.policy != "fifo":
+            self._renew(node)
+        node.value = value
+        return node.order_id
+
+    def _new_node(self, destination, activity, username, phone):
+        node = super()._new_node(destination, activity, username, phone)
+        if self.ttl is not None:
+            node.expires_at = self.clock() + self.ttl
+        return node
+
+    def _index(self, node):
+        # Keyed entries are found through entries, orders through by_key
+        if node.key is self.NO_KEY:
+            super()._index(node)
+        else:
+            self.entries[node.key] = node
+
+    def _unindex(self, node):
+        if node.key is self.NO_KEY:
+            super()._unindex(node)
+        else:
+            del self.entries[node.key]
+
+    def _make_room(self):
+        self.purge_expired()
+        if self.size == self.max_size:
+            self._evict(self.head)
+
+    def get(self, key, default=None):
+        # The value cached under key, or default on a miss (including an expired entry)
+        node = self._lookup(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.policy == "lru":
+            self._renew(node)
+        return node.value
+
+    def __contains__(self, key):
+        # Membership test that counts neither a hit nor a miss
+        return self._lookup(key) is not None
+
+    def touch(self, key):
+        # Mark an entry as recently used without counting a hit; False if it is not cached
+        node = self._lookup(key)
+        if node is None:
+            return False
+        if self.policy != "fifo":
+            self._renew(node)
+        return True
+
+    def _lookup(self, key):
+        # The live entry for key, evicting it first if it has expired
+        node = self.entries.get(key)
+        if node is not None and self._expired(node):
+            self._evict(node)
+            return None
+        return node
+
+    def purge_expired(self):
+        # The list stays sorted by expiry (renewed orders move to the back), so only the head is checked
+        while self.head is not None and self._expired(self.head):
+            self._evict(self.head)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": self.size}
+
+    def _expired(self, node):
+        return node.expires_at is not None and node.expires_at <= self.clock()
+
+    def _renew(self, node):
+        self.move_to_back(node.order_id)
+        if self.ttl is not None:
+            node.expires_at = self.clock() + self.ttl
+
+    def _evict(self, node):
+        self.remove_order_id(node.order_id)
+        self.evictions += 1
+
+
+# Treeview that only materializes the visible window of a DoublyLinkedList
+class VirtualOrderView:
+    def __init__(self, treeview, order_list, rows):
+        self.treeview = treeview
+        self.order_list = order_list
+        self.rows = rows  # Size of the visible window
+        self.top = order_list.head  # Cursor: first visible order
+        order_list.subscribe(self.on_change)
+        self.refresh()
+
+    def refresh(self):
+        # Repaint the window from the cursor; costs O(rows), whatever the list length
+        self.treeview.delete(*self.treeview.get_children())
+        if self.top is None:
+            self.treeview.insert("", "end", iid="empty", values=("No orders", "", "", ""))
+            return
+        node = self.top
+        for _ in range(self.rows):
+            if node is None:
+                break
+            self._insert_row("end", node)
+            node = node.next
+
+    def scroll(self, steps):
+        # Move the cursor by steps orders (negative scrolls up) and repaint the window
+        node = self.top
+        if node is None:
+            return
+        while steps > 0 and node.next:
+            node = node.next
+            steps -= 1
+        while steps < 0 and node.prev:
+            node = node.prev
+            steps += 1
+        if node is not self.top:
+            self.top = node
+            self.refresh()
+
+    def on_change(self, event, node):
+        # Apply a single-row delta for one order joining or leaving the list
+        if event == "linked":
+            if self.top is None:
+                self.top = node
+                self.refresh()
+            elif (node.prev is not None and len(self.treeview.get_children()) < self.rows
+                  and self.treeview.exists(str(node.prev.order_id))):
+                self._insert_row(self.treeview.index(str(node.prev.order_id)) + 1, node)
+        elif event == "unlinking":
+            if not self.treeview.exists(str(node.order_id)):
+                return  # Outside the window, nothing on screen changes
+            self.treeview.delete(str(node.order_id))
+            if node is self.top:
+                self.top = node.next or node.prev
+                if self.top is None:
+                    self.refresh()  # The list is now empty
+                    return
+                if self.top is node.prev:  # The window only held the last order; slide back by one
+                    self._insert_row(0, self.top)
+                    return
+            children = self.treeview.get_children()
+            if not children:
+                self._insert_row("end", self.top)
+                return
+            # Pull the order after the window up into the freed bottom row
+            last = self.order_list.get_order(int(children[-1]))
+            following = last.next if last.next is not node else node.next
+            if following is not None:
+                self._insert_row("end", following)
+
+    def _insert_row(self, index, node):
+        self.treeview.insert("", index, iid=str(node.order_id),
+                             values=(node.destination, node.activity, node.username, node.phone))
+
+
 # Travel itinerary app with fixed number of orders
 class TravelItineraryApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Travel Itinerary Planner")
         self.max_orders = 5  # Fixed number of orders
-        self.order_list = DoublyLinkedList(self.max_orders)
+        self.order_list = OrderCache(self.max_orders, policy="fifo")  # The oldest order makes room for a new one
         self.create_widgets()
 
         # Maximize the window without hiding buttons
@@ -135,16 +477,18 @@ class TravelItineraryApp:
         self.treeview.heading("Phone", text="Phone")
         self.treeview.grid(row=7, column=0, columnspan=2, padx=10, pady=10)
 
+        # Only the visible rows are ever in the Treeview; the mouse wheel moves the window
+        self.order_view = VirtualOrderView(self.treeview, self.order_list, rows=5)
+        self.treeview.bind("<MouseWheel>", lambda event: self.order_view.scroll(-1 if event.delta > 0 else 1))
+        self.treeview.bind("<Button-4>", lambda event: self.order_view.scroll(-1))
+        self.treeview.bind("<Button-5>", lambda event: self.order_view.scroll(1))
+
     def add_order(self):
         username = self.username_entry.get()
         phone = self.phone_entry.get()
         destination = self.destination_var.get()
         activity = self.activity_var.get()
 
-        if self.order_list.is_full():
-            messagebox.showerror("Error", "Cannot add more orders. Maximum limit reached.")
-            return
-
         if destination == "Select the Destination" or activity == "Select the Activity":
             messagebox.showerror("Error", "Please select both a destination and an activity.")
             return
@@ -153,15 +497,26 @@ class TravelItineraryApp:
             messagebox.showerror("Error", "Please enter both username and phone number.")
             return
 
+        oldest = self.order_list.head if self.order_list.is_full() else None
         success = self.order_list.insert_order(destination, activity, username, phone)
-        if success:
+        if success and oldest is not None:
+            messagebox.showinfo("Success", f"Order added: {destination} - {activity}\n"
+                                           f"Oldest order replaced: {oldest.destination} - {oldest.activity}")
+        elif success:
             messagebox.showinfo("Success", f"Order added: {destination} - {activity}")
-        self.display_orders()  # Update the displayed orders
 
     def remove_order(self):
         destination = self.destination_var.get()
         activity = self.activity_var.get()
 
+        # A selected row identifies one exact order, even when several share a destination/activity
+        selected = [row for row in self.treeview.selection() if row.isdigit()]
+        if selected:
+            node = self.order_list.get_order(int(selected[0]))
+            self.order_list.remove_order_id(node.order_id)
+            messagebox.showinfo("Success", f"Order removed: {node.destination} - {node.activity}")
+            return
+
         if destination == "Select the Destination" or activity == "Select the Activity":
             messagebox.showerror("Error", "Please select both a destination and an activity.")
             return
@@ -171,20 +526,10 @@ class TravelItineraryApp:
             messagebox.showinfo("Success", f"Order removed: {destination} - {activity}")
         else:
             messagebox.showerror("Error", "Order not found.")
-        self.display_orders()  # Update the displayed orders
 
     def display_orders(self):
-        for row in self.treeview.get_children():
-            self.treeview.delete(row)
-
-        current = self.order_list.head
-        if not current:
-            self.treeview.insert("", "end", values=("No orders", "", "", ""))
-            return
-
-        while current:
-            self.treeview.insert("", "end", values=(current.destination, current.activity, current.username, current.phone))
-            current = current.next
+        # Adds and removals already update the Treeview row by row; this repaints the visible window
+        self.order_view.refresh()
 
 
 # Run the app